@@ -129,7 +129,18 @@ class K2Search(MASTSearch):
                 if f"c{row['sequence_number']}{half}" in row["productFilename"]:
                     seq_num[index] = f"{int(row['sequence_number']):02d}{letter}"
 
-        self.table["campaign"] = seq_num
+        # An ordered categorical sorts campaigns numerically, with split halves in order
+        self.table["campaign"] = pd.Categorical(
+            seq_num,
+            categories=sorted(set(seq_num), key=self._campaign_order),
+            ordered=True,
+        )
+
+    @staticmethod
+    def _campaign_order(campaign: str):
+        """Sort key for campaign names, e.g. "4" < "09a" < "09b" < "10a" """
+        match = re.match(r"(\d+)", campaign)
+        return (int(match.group(1)) if match else np.inf, campaign)
 
     def _sort_K2(self):
         # No specific preference for K2 HLSPs
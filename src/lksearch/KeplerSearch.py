@@ -20,9 +20,10 @@ class KeplerSearch(MASTSearch):
 
     Parameters
     ----------
-    target: Optional[Union[str, tuple[float], SkyCoord]] = None
+    target: Optional[Union[str, tuple[float], SkyCoord, list[str]]] = None
         The target to search for observations of. Can be provided as a name (string),
         coordinates in decimal degrees (tuple), or Astropy `~astropy.coordinates.SkyCoord` Object.
+        A list of KIC IDs searches for all of those targets at once, see `KeplerSearch.multi`.
     obs_table:Optional[pd.DataFrame] = None
         Optionally, can provice a Astropy `~astropy.table.Table` Object from
         AstroQuery `astroquery.mast.Observations.query_criteria` which will be used to construct the observations table
@@ -61,7 +62,7 @@ class KeplerSearch(MASTSearch):
 
     def __init__(
         self,
-        target: [Union[str, tuple[float], SkyCoord]],
+        target: [Union[str, tuple[float], SkyCoord, list[str]]],
         obs_table: Optional[pd.DataFrame] = None,
         prod_table: Optional[pd.DataFrame] = None,
         table: Optional[pd.DataFrame] = None,
@@ -96,6 +97,25 @@ class KeplerSearch(MASTSearch):
             # Can't search mast with quarter/month directly, so filter on that after the fact.
             self.table = self.table[self._filter_kepler(quarter, month)]
 
+    @classmethod
+    def multi(cls, targets: list[str], **kwargs):
+        """Search for several Kepler targets with a single MAST query
+
+        Parameters
+        ----------
+        targets : list[str]
+            KIC IDs of the targets to search for, e.g. ["KIC 5112705", "KIC 10058374"]
+        **kwargs
+            Other search parameters passed to `KeplerSearch`
+
+        Returns
+        -------
+        KeplerSearch
+            search containing the products of all targets,
+            which can be told apart by their `target_name`
+        """
+        return cls(list(targets), **kwargs)
+
     @property
     def HLSPs(self):
         """return a MASTSearch object with self.table only containing High Level Science Products"""
@@ -108,6 +128,34 @@ class KeplerSearch(MASTSearch):
         mask = self.table["mission_product"]
         return self._mask(mask)
 
+    def _parse_input(self, search_input: Union[str, tuple[float], SkyCoord, list[str]]):
+        """Parses the provided target input search information based on input type.
+        A list of KIC IDs is searched for by exact target name,
+        otherwise see `MASTSearch._parse_input`
+
+        Raises
+        ------
+        TypeError
+            If a list containing anything other than KIC IDs is passed
+        ValueError
+            If an empty list is passed, or a list is combined with a search radius
+        """
+        if not isinstance(search_input, list):
+            return super()._parse_input(search_input)
+
+        if len(search_input) == 0:
+            raise ValueError("No targets given to search for")
+        targets = [self._check_exact(str(target).lower()) for target in search_input]
+        if not all(targets):
+            raise TypeError("Multiple targets must be given as a list of KIC IDs")
+        if self.search_radius is not None:
+            raise ValueError("search_radius cannot be used with multiple targets")
+
+        self.exact_target = True
+        self.exact_target_name = [self._target_to_exact_name(t) for t in targets]
+        self.target_search_string = ", ".join(self.exact_target_name)
+        self.SkyCoord = None
+
     def _check_exact(self, target):
         """Was a Kepler target ID passed?"""
         return re.match(r"^(kplr|kic) ?(\d+)$", target)
@@ -157,13 +157,13 @@ class MASTSearch(object):
             if len(key) == len(self.table):
                 return self._mask(key)
 
-        if isinstance(key, (slice, int)) or (intlist):
-            if not intlist:
-                mask = np.in1d(
-                    np.arange(len(self.table)), np.arange(len(self.table))[key]
-                )
-            else:
-                mask = np.in1d(self.table.index, key)
+        if isinstance(key, slice):
+            return self._take(np.arange(*key.indices(len(self.table))))
+        if isinstance(key, int):
+            # Index positionally, so that negative keys count back from the end
+            return self._take(np.atleast_1d(np.arange(len(self.table))[key]))
+        if intlist:
+            mask = np.in1d(self.table.index, key)
             return self._mask(mask)
         if isinstance(key, str) or strlist:
             # Return a column as a series, or a dataframe of columns
@@ -336,11 +336,32 @@ class MASTSearch(object):
 
     # def _downsize_table(self, ds_table):
     def _mask(self, mask):
-        """Masks down the product and observation tables given an input mask, then returns them as a new Search object.
-        deepcopy is used to preserve the class metadata stored in class variables"""
-
-        new_MASTSearch = deepcopy(self)
-        new_MASTSearch.table = new_MASTSearch.table[mask].reset_index(drop=True)
+        """Masks down the product and observation tables given an input mask, then returns them as a new Search object."""
+        return self._take(np.flatnonzero(np.asarray(mask, dtype=bool)))
+
+    def _take(self, idx):
+        """Returns a new Search object whose table holds the rows at the integer positions in idx.
+        deepcopy is used to preserve the class metadata stored in class variables.
+        The full table is left out of the copy, the obs_table & prod_table it was built
+        from are shared with the new object, and the column attributes are rebuilt
+        from the new table
+        """
+        columns = [
+            col
+            for col in self.table.columns
+            if isinstance(getattr(self, col, None), pd.Series)
+        ]
+        memo = {id(self.table): None}
+        for name in ["obs_table", "prod_table"]:
+            value = getattr(self, name, None)
+            memo[id(value)] = value
+        for col in columns:
+            memo[id(getattr(self, col))] = None
+
+        new_MASTSearch = deepcopy(self, memo)
+        new_MASTSearch.table = self.table.take(idx).reset_index(drop=True)
+        for col in columns:
+            setattr(new_MASTSearch, col, new_MASTSearch.table[col])
 
         return new_MASTSearch
 
@@ -735,8 +756,11 @@ class MASTSearch(object):
         ~pandas.DataFrame
             product table from ~astroquery.mast.Observations.get_product_list.to_pandas
         """
-        # Use the search result to get a product list
-        products = Observations.get_product_list(Table.from_pandas(self.obs_table))
+        # Use the search result to get a product list. Only the observation ids
+        # (and target names, which astroquery uses to skip FFIs) are needed, so
+        # avoid converting the whole observations table back into an astropy Table
+        obs_ids = self.obs_table[["obsid", "obs_id", "target_name"]]
+        products = Observations.get_product_list(Table.from_pandas(obs_ids))
         return products.to_pandas()
 
     def _join_tables(self):
@@ -289,19 +289,27 @@ class TESSSearch(MASTSearch):
 
     def search_sector_ffis(
         self,
-        # tmin: Union[float, Time, tuple] = None,
-        # tmax: Union[float, Time, tuple] = None,
         # search_radius: Union[float, u.Quantity] = 0.0001 * u.arcsec,
         # exptime: Union[str, int, tuple] = (0, 9999),
         sector: Union[int, type[None]],  # = None,
+        tmin: Optional[Union[float, Time]] = None,
+        tmax: Optional[Union[float, Time]] = None,
         **extra_query_criteria,
     ):
         """Returns a list of the FFIs available in a particular sector
 
+        All FFIs in the sector are found with a single MAST query, and are then
+        filtered down to the requested time range locally, using the end of each
+        FFI exposure as given by the timestamp in its name.
+
         Parameters
         ----------
         sector : Union[int, type[None]]
             sector(s) in which to search for FFI files, by default None
+        tmin : Optional[Union[float, Time]], optional
+            only return FFIs taken at or after this time (UTC MJD if a float), by default None
+        tmax : Optional[Union[float, Time]], optional
+            only return FFIs taken at or before this time (UTC MJD if a float), by default None
 
         Returns
         -------
@@ -356,8 +364,68 @@ class TESSSearch(MASTSearch):
         new_table.table["t_min"] = pd.NA * len(new_table.table)
         new_table.table["t_max"] = pd.NA * len(new_table.table)
 
+        if (tmin is not None) or (tmax is not None):
+            mask = self._ffi_time_mask(new_table.table["obs_id"], tmin, tmax)
+            new_table = new_table._mask(mask)
+
         return new_table
 
+    @staticmethod
+    def _ffi_time_mask(
+        obs_id: pd.Series,
+        tmin: Optional[Union[float, Time]] = None,
+        tmax: Optional[Union[float, Time]] = None,
+    ):
+        """Returns a boolean mask of the FFIs taken between tmin and tmax (inclusive)
+
+        Parameters
+        ----------
+        obs_id : pd.Series
+            FFI observation ids
+        tmin : Optional[Union[float, Time]], optional
+            earliest time to keep (UTC MJD if a float), by default None
+        tmax : Optional[Union[float, Time]], optional
+            latest time to keep (UTC MJD if a float), by default None
+        """
+        # FFI names are timestamped in UTC, so convert limits in other time scales
+        ffi_mjd = TESSSearch._ffi_time(obs_id).mjd
+        mask = np.ones(len(obs_id), dtype=bool)
+        if tmin is not None:
+            mask &= ffi_mjd >= Time(tmin, format="mjd").utc.mjd
+        if tmax is not None:
+            mask &= ffi_mjd <= Time(tmax, format="mjd").utc.mjd
+        return mask
+
+    @staticmethod
+    def _ffi_time(obs_id: pd.Series):
+        """Parse the timestamps encoded in FFI names,
+        e.g. tess2019199202929-s0014-1-1-0150-s is 2019, day 199, 20:29:29 UTC.
+        The timestamp marks the end of the FFI exposure.
+
+        Parameters
+        ----------
+        obs_id : pd.Series
+            FFI observation ids
+
+        Returns
+        -------
+        ~astropy.time.Time
+            the time of each FFI
+        """
+        stamp = obs_id.str.split("-").str[0].str[4:]
+        yday = (
+            stamp.str[:4]
+            + ":"
+            + stamp.str[4:7]
+            + ":"
+            + stamp.str[7:9]
+            + ":"
+            + stamp.str[9:11]
+            + ":"
+            + stamp.str[11:13]
+        )
+        return Time(yday.values.tolist(), format="yday", scale="utc")
+
     def filter_table(
         self,
         target_name: Union[str, list[str]] = None,
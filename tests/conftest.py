@@ -0,0 +1,247 @@
+"""Shared fixtures for tests that interact with the data archive at MAST.
+
+Set the environment variable ``LKSEARCH_TEST_CACHE=1`` to keep the HTTP responses
+from MAST in a local SQLite cache (requires ``requests_cache``), and the results
+of MAST queries in the pytest cache directory, so that repeated test runs within
+a day do not need to query MAST again.
+"""
+
+import hashlib
+import os
+import pickle
+import time
+import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
+import numpy as np
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def _is_complete(response):
+    """Don't cache MAST portal responses for queries that are still executing,
+    as astroquery keeps polling until the status changes"""
+    if "json" not in response.headers.get("Content-Type", ""):
+        return True
+    try:
+        result = response.json()
+    except ValueError:
+        return True
+    return not (isinstance(result, dict) and result.get("status") == "EXECUTING")
+
+
+# Persist MAST responses between test runs, for at most CACHE_EXPIRY seconds
+USE_TEST_CACHE = os.environ.get("LKSEARCH_TEST_CACHE") == "1"
+CACHE_EXPIRY = 86400
+
+# Install before importing astroquery, so that the sessions it creates are cached
+if USE_TEST_CACHE:
+    try:
+        import requests_cache
+    except ImportError as exc:
+        raise ImportError(
+            "LKSEARCH_TEST_CACHE=1 needs requests_cache, "
+            "install it with `pip install requests-cache`"
+        ) from exc
+
+    requests_cache.install_cache(
+        ".pytest_mast_cache",
+        backend="sqlite",
+        expire_after=CACHE_EXPIRY,
+        allowable_codes=(200,),
+        allowable_methods=("GET", "POST"),
+        filter_fn=_is_complete,
+    )
+
+from astropy.table import Table  # noqa
+from astropy.utils import iers  # noqa
+from astroquery.mast import MastClass, Observations, Tesscut  # noqa
+
+MAST_URL = "https://mast.stsci.edu"
+
+# Observations methods whose responses are memoized for the whole test session
+_CACHED_QUERIES = ["query_criteria", "query_object", "get_product_list"]
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-network",
+        action="store_true",
+        default=False,
+        help="Download data products from MAST instead of using placeholder files",
+    )
+
+
+class _TimeoutAdapter(HTTPAdapter):
+    """HTTPAdapter which applies a default timeout to every request"""
+
+    def __init__(self, timeout, **kwargs):
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+def _normalize(value):
+    """Turn a query argument into a stable, hashable representation"""
+    if isinstance(value, Table):
+        # Product lists are requested for a table of observations, which is
+        # uniquely identified by its obsids
+        if "obsid" in value.colnames:
+            return ("Table", tuple(str(obsid) for obsid in value["obsid"]))
+        return ("Table", repr(value.as_array().tolist()))
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return repr(value)
+
+
+def _cache_key(name, args, kwargs):
+    """Hash a query name and its normalized arguments"""
+    key = [name, [_normalize(arg) for arg in args]]
+    key += [(k, _normalize(v)) for k, v in sorted(kwargs.items())]
+    return hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+
+
+def _memoize(name, query, cache):
+    """Wrap an Observations query so repeated calls are served from `cache`"""
+
+    def wrapper(*args, **kwargs):
+        key = _cache_key(name, args, kwargs)
+        if key not in cache:
+            result = query(*args, **kwargs)
+            # Callers modify the returned table in place, so keep our own copy
+            cache[key] = result.copy()
+            return result
+        return cache[key].copy()
+
+    return wrapper
+
+
+@pytest.fixture(scope="session", autouse=True)
+def mast_query_cache(request):
+    """Memoize MAST observation queries for the duration of the test session.
+
+    Many tests search for the same targets, so identical `query_criteria`,
+    `query_object` and `get_product_list` calls, and target name resolution,
+    are only sent to MAST once.
+    With ``LKSEARCH_TEST_CACHE=1`` the responses are also persisted in the pytest
+    cache directory for a day, so that reruns do not need to query MAST at all.
+    """
+    cache = {}
+    created = time.time()
+    cache_file = None
+    if USE_TEST_CACHE and getattr(request.config, "cache", None) is not None:
+        cache_file = request.config.cache.mkdir("mast") / "mast_cache.pkl"
+        if cache_file.is_file():
+            try:
+                with open(cache_file, "rb") as f:
+                    saved = pickle.load(f)
+                if time.time() - saved["created"] < CACHE_EXPIRY:
+                    cache, created = saved["queries"], saved["created"]
+            except (OSError, EOFError, pickle.UnpicklingError, KeyError) as exc:
+                warnings.warn(f"Ignoring unreadable MAST query cache: {exc}")
+
+    with pytest.MonkeyPatch.context() as mp:
+        for name in _CACHED_QUERIES:
+            query = getattr(Observations, name)
+            mp.setattr(Observations, name, _memoize(name, query, cache))
+        # Searches resolve names with a new MastClass instance each time
+        resolve_object = _memoize("resolve_object", MastClass().resolve_object, cache)
+        mp.setattr(
+            MastClass,
+            "resolve_object",
+            lambda self, *args, **kwargs: resolve_object(*args, **kwargs),
+        )
+        yield cache
+
+    if cache_file is not None:
+        # Write then rename, as parallel test workers may each save their cache
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump({"created": created, "queries": cache}, f)
+        os.replace(tmp_file, cache_file)
+
+
+@pytest.fixture(scope="session")
+def executor():
+    """Thread pool for sending independent MAST searches concurrently"""
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        yield pool
+
+
+@pytest.fixture(autouse=True)
+def placeholder_downloads(request, monkeypatch, tmp_path):
+    """Replace MAST downloads with empty placeholder files.
+
+    Searches still query MAST, but `download()` returns a manifest pointing at
+    empty files in a temporary directory rather than fetching the data products.
+    Pass ``--run-network`` to download the real files.
+    """
+    if request.config.getoption("--run-network"):
+        return
+
+    def download_products(products, download_dir=None, **kwargs):
+        local_paths = []
+        for filename in products["productFilename"]:
+            local_path = tmp_path / filename
+            local_path.touch()
+            local_paths.append(str(local_path))
+        n_products = len(local_paths)
+        return Table(
+            {
+                "Local Path": local_paths,
+                "Status": ["COMPLETE"] * n_products,
+                "Message": [None] * n_products,
+                "URL": [None] * n_products,
+            }
+        )
+
+    def download_cutouts(coordinates=None, size=5, sector=None, **kwargs):
+        local_path = tmp_path / f"tess-s{sector:04d}-cutout.fits"
+        local_path.touch()
+        return Table({"Local Path": [str(local_path)]})
+
+    monkeypatch.setattr(Observations, "download_products", download_products)
+    monkeypatch.setattr(Tesscut, "download_cutouts", download_cutouts)
+
+
+@pytest.fixture(scope="session")
+def mast_available():
+    """Skip tests that need MAST if it is not responding, and bound how long
+    MAST requests may take so that a slow archive fails fast instead of stalling.
+    """
+    # Ask MAST directly, as a cached response would hide an outage
+    uncached = requests_cache.disabled() if USE_TEST_CACHE else nullcontext()
+    try:
+        with uncached:
+            response = requests.get(MAST_URL, timeout=3)
+    except requests.RequestException as exc:
+        pytest.skip(f"MAST is unreachable: {exc}")
+    if not response.ok:
+        pytest.skip(f"MAST is unavailable (HTTP {response.status_code})")
+
+    session = Observations._session
+    with pytest.MonkeyPatch.context() as mp:
+        # Mount on a copy of the adapters so the originals are restored afterwards
+        mp.setattr(session, "adapters", OrderedDict(session.adapters))
+        session.mount("https://", _TimeoutAdapter(timeout=10))
+        # Overall limit on polling MAST for a query that is still executing
+        mp.setattr(Observations._portal_api_connection, "TIMEOUT", 60)
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def frozen_iers():
+    """Use the IERS-B table bundled with astropy instead of downloading IERS-A.
+    The tests don't need up-to-date Earth orientation data."""
+    with iers.conf.set_temp("auto_download", False):
+        with iers.earth_orientation_table.set(iers.IERS_B.open()):
+            yield
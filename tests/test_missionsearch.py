@@ -13,13 +13,44 @@ import astropy.units as u
 import pandas as pd
 
 
-from lksearch.utils import SearchError, SearchWarning
+from lksearch.utils import SearchError
 
 from lksearch import MASTSearch, TESSSearch, KeplerSearch, K2Search
 from lksearch import conf
 
+# Every test in this module queries MAST, offline tests go in test_search_offline.py
+pytestmark = pytest.mark.usefixtures("mast_available")
 
-def test_search_cubedata():
+# Coordinates of a Kepler Quarter 6 target, built once from Quantities rather
+# than parsed from a string in each test
+Q6_TARGET = SkyCoord(297.5835 * u.deg, 40.98339 * u.deg)
+# Kepler-10 at the position encoded in its 2MASS designation, J19024305+5014286
+KEPLER10_2MASS = SkyCoord("19h02m43.05s +50d14m28.6s")
+
+
+@pytest.fixture(scope="session")
+def kepler10():
+    """Kepler-10 (KIC 11904151), resolved once per test session"""
+    from astropy.coordinates.name_resolve import sesame_database
+
+    # Query SIMBAD directly rather than trying every Sesame resolver in turn
+    with sesame_database.set("simbad"):
+        return SkyCoord.from_name("KIC 11904151")
+
+
+@pytest.fixture(scope="session")
+def pi_men_s1():
+    """TESS Sector 1 SPOC products for pi Mensae"""
+    return TESSSearch("pi Mensae", sector=1, pipeline="SPOC")
+
+
+@pytest.fixture(scope="session")
+def tres2b_s26():
+    """All TESS Sector 26 products for TrES-2b (aka TOI 2140.01)"""
+    return TESSSearch("TrES-2b", sector=26)
+
+
+def test_search_cubedata(pi_men_s1):
     # EPIC 210634047 was observed twice in long cadence
     assert len(K2Search("EPIC 210634047").cubedata.table) == 2
     # ...including Campaign 4
@@ -48,35 +79,60 @@ def test_search_cubedata():
         == 2
     )
 
-    manifest = TESSSearch(tic, pipeline="SPOC", sector=1).download()
-    assert len(manifest) == len(TESSSearch(tic, pipeline="SPOC", sector=1))
-    assert len(TESSSearch("pi Mensae", sector=1, pipeline="SPOC").cubedata.table) == 1
+    search = TESSSearch(tic, pipeline="SPOC", sector=1)
+    manifest = search.download()
+    assert len(manifest) == len(search)
+    assert len(pi_men_s1.cubedata.table) == 1
     # Issue #445: indexing with -1 should return the last index of the search result
     assert len(TESSSearch("pi Mensae").cubedata[-1].table) == 1
 
 
-def test_search_split_campaigns():
+# (campaign, target) pairs observed in both halves of the split K2 campaigns
+SPLIT_CAMPAIGN_TPFS = [
+    (9, "EPIC 228162462"),
+    (10, "EPIC 228726301"),
+    (11, "EPIC 202975993"),
+]
+SPLIT_CAMPAIGN_NAMES = [
+    (9, "EPIC 228162462"),
+    (10, "EPIC 228725972"),
+    (11, "EPIC 203830112"),
+]
+
+
+@pytest.fixture(scope="module")
+def split_campaigns(executor):
+    """Long cadence K2 searches of the split campaign targets, sent to MAST
+    concurrently. Maps (campaign, target) to a future of the K2Search."""
+    return {
+        (campaign, target): executor.submit(
+            K2Search, target, exptime="long", campaign=campaign
+        )
+        for campaign, target in set(SPLIT_CAMPAIGN_TPFS + SPLIT_CAMPAIGN_NAMES)
+    }
+
+
+@pytest.mark.parametrize("campaign, target", SPLIT_CAMPAIGN_TPFS)
+def test_search_split_campaigns(split_campaigns, campaign, target):
     """Searches should should work for split campaigns.
 
     K2 Campaigns 9, 10, and 11 were split into two halves for various technical
     reasons (C91=C9a, C92=C9b, C101=C10a, C102=C10b, C111=C11a, C112=C11b).
     We expect most targets from those campaigns to return two TPFs.
     """
-    campaigns = [9, 10, 11]
-    ids = ["EPIC 228162462", "EPIC 228726301", "EPIC 202975993"]
-    for c, idx in zip(campaigns, ids):
-        sr = K2Search(idx, campaign=c, exptime="long").cubedata.table
-        assert len(sr) == 2
+    sr = split_campaigns[campaign, target].result().cubedata.table
+    assert len(sr) == 2
 
 
-def test_search_timeseries(caplog):
-    # We should also be able to resolve targets by name instead of KIC ID
-    # The name Kepler-10 somehow no longer works on MAST. So we use 2MASS instead:
+def test_search_timeseries(caplog, pi_men_s1):
+    # We should also be able to find targets by position instead of KIC ID
+    # The name Kepler-10 somehow no longer works on MAST. So we use the position
+    # from its 2MASS designation instead, which avoids a name resolver lookup:
     #   https://simbad.cds.unistra.fr/simbad/sim-id?Ident=%405506010&Name=Kepler-10
     assert (
         len(
             KeplerSearch(
-                "2MASS J19024305+5014286", pipeline="Kepler", exptime="long"
+                KEPLER10_2MASS, pipeline="Kepler", exptime="long"
             ).timeseries.table
         )
         == 15
@@ -87,24 +143,13 @@ def test_search_timeseries(caplog):
     #    MASTSearch("DOES_NOT_EXIST (UNIT TEST)").timeseries
 
     # If we ask for all cadence types, there should be four Kepler files given
-    assert (
-        len(
-            KeplerSearch(
-                "KIC 4914423", quarter=6, exptime="any", pipeline="Kepler"
-            ).timeseries.table
-        )
-        == 4
-    )
+    all_q6 = KeplerSearch(
+        "KIC 4914423", quarter=6, exptime="any", pipeline="Kepler"
+    ).timeseries
+    assert len(all_q6.table) == 4
 
     # ...and only one should have long cadence
-    assert (
-        len(
-            KeplerSearch(
-                "KIC 4914423", quarter=6, exptime="long", pipeline="Kepler"
-            ).timeseries.table
-        )
-        == 1
-    )
+    assert len(all_q6.filter_table(exptime="long").table) == 1
     # Should be able to resolve an ra/dec from a string
     assert (
         len(
@@ -124,8 +169,7 @@ def test_search_timeseries(caplog):
         == 1
     )
     # Should be able to resolve a SkyCoord
-    c = SkyCoord("297.5835 40.98339", unit=(u.deg, u.deg))
-    search = KeplerSearch(c, quarter=6, pipeline="Kepler").timeseries
+    search = KeplerSearch(Q6_TARGET, quarter=6, pipeline="Kepler").timeseries
     assert len(search.table) == 1
     assert len(search) == 1
 
@@ -144,19 +188,17 @@ def test_search_timeseries(caplog):
         )
         == 2
     )
-    assert len(TESSSearch("pi Mensae", pipeline="SPOC", sector=1).timeseries.table) == 1
+    assert len(pi_men_s1.timeseries.table) == 1
 
 
-def test_search_with_skycoord():
+def test_search_with_skycoord(kepler10):
     """Can we pass both names, SkyCoord objects, and coordinate strings?"""
     sr_name = KeplerSearch("KIC 11904151", exptime="long").cubedata
     assert (
         len(sr_name) == 15
     )  # Kepler-10 as observed during 15 quarters in long cadence
     # Can we search using a SkyCoord objects?
-    sr_skycoord = KeplerSearch(
-        SkyCoord.from_name("KIC 11904151"), exptime="long"
-    ).cubedata
+    sr_skycoord = KeplerSearch(kepler10, exptime="long").cubedata
     assert len(sr_skycoord) == 15
     assert_array_equal(
         sr_name.table["productFilename"], sr_skycoord.table["productFilename"]
@@ -199,38 +241,22 @@ def test_month():
 
 
 def test_collections():
-    assert len(K2Search("EPIC 205998445", search_radius=900).cubedata.table) == 4
-    assert (
-        len(
-            MASTSearch(
-                "EPIC 205998445", mission="K2", search_radius=900, pipeline="K2"
-            ).filter_table(limit=3)
-        )
-        == 3
-    )
-    # if fewer targets are found than targetlimit, should still download all available
-    assert (
-        len(
-            K2Search("EPIC 205998445", search_radius=900, pipeline="K2")
-            .cubedata.filter_table(limit=6)
-            .table
-        )
-        == 4
-    )
+    search = MASTSearch("EPIC 205998445", mission="K2", search_radius=900)
+    k2_search = search.filter_table(pipeline="K2")
+    assert len(k2_search.filter_table(limit=3)) == 3
+    assert isinstance(k2_search.cubedata.download(), pd.DataFrame)
 
-    assert isinstance(
-        MASTSearch(
-            "EPIC 205998445", mission="K2", search_radius=900, pipeline="K2"
-        ).cubedata.download(),
-        pd.DataFrame,
-    )
+    cubedata = K2Search("EPIC 205998445", search_radius=900).cubedata
+    assert len(cubedata.table) == 4
+    # if fewer targets are found than targetlimit, should still download all available
+    assert len(cubedata.filter_table(pipeline="K2", limit=6).table) == 4
 
 
 def test_properties():
-    c = SkyCoord("297.5835 40.98339", unit=(u.deg, u.deg))
-    assert_almost_equal(KeplerSearch(c, quarter=6).cubedata.ra[0], 297.5835)
-    assert_almost_equal(KeplerSearch(c, quarter=6).cubedata.dec[0], 40.98339)
-    assert len(KeplerSearch(c, quarter=6).cubedata.target_name) == 1
+    cubedata = KeplerSearch(Q6_TARGET, quarter=6).cubedata
+    assert_almost_equal(cubedata.ra[0], 297.5835)
+    assert_almost_equal(cubedata.dec[0], 40.98339)
+    assert len(cubedata.target_name) == 1
 
 
 def test_source_confusion():
@@ -243,15 +269,6 @@ def test_source_confusion():
     assert "6507433" in tpf.target_name[0]
 
 
-def test_empty_searchresult():
-    """Does an empty SearchResult behave gracefully?"""
-    sr = MASTSearch(table=pd.DataFrame())
-    assert len(sr) == 0
-    str(sr)
-    with pytest.warns(SearchWarning, match="Cannot download"):
-        sr.download()
-
-
 def test_issue_472():
     """Regression test for https://github.com/lightkurve/lightkurve/issues/472"""
     # The line below previously threw an exception because the target was not
@@ -339,16 +356,18 @@ def test_indexerror_631():
     assert len(result) == 1
 
 
-def test_overlapping_targets_718():
+@pytest.mark.parametrize("target", ["KIC 5112705", "KIC 10058374", "KIC 5385723"])
+def test_overlapping_targets_718(target):
     """Regression test for #718."""
     # Searching for the following targets without radius should only return
     # the requested targets, not their overlapping neighbors.
-    targets = ["KIC 5112705", "KIC 10058374", "KIC 5385723"]
-    for target in targets:
-        search = KeplerSearch(target, quarter=11, pipeline="Kepler").timeseries
-        assert len(search) == 1
-        assert search.target_name[0] == f"kplr{target[4:].zfill(9)}"
+    search = KeplerSearch(target, quarter=11, pipeline="Kepler").timeseries
+    assert len(search) == 1
+    assert search.target_name[0] == f"kplr{target[4:].zfill(9)}"
 
+
+def test_overlapping_targets_718_radius():
+    """Regression test for #718."""
     # When using `radius=1` we should also retrieve the overlapping targets
     search = KeplerSearch(
         "KIC 5112705", quarter=11, pipeline="Kepler", search_radius=1 * u.arcsec
@@ -356,6 +375,16 @@ def test_overlapping_targets_718():
     assert len(search) > 1
 
 
+def test_kepler_multi():
+    """Can several Kepler targets be found with a single search?"""
+    targets = ["KIC 5112705", "KIC 10058374", "KIC 5385723"]
+    search = KeplerSearch.multi(targets, quarter=11, pipeline="Kepler").timeseries
+    n_products = search.table.groupby("target_name").size()
+    assert n_products.to_dict() == {
+        f"kplr{target[4:].zfill(9)}": 1 for target in targets
+    }
+
+
 def test_tesscut_795():
     """Regression test for #795: make sure the __repr__.of a TESSCut
     SearchResult works."""
@@ -386,49 +415,39 @@ def test_search_slicing_regression():
     res[res.exptime[0] < 100]
 
 
-def test_ffi_hlsp():
+def test_ffi_hlsp(tres2b_s26):
     """Can SPOC, QLP (FFI), and TESS-SPOC (FFI) light curves be accessed?"""
-    search = TESSSearch("TrES-2b", sector=26).timeseries  # aka TOI 2140.01
-    assert search.table["pipeline"].str.contains("QLP").any()
-    assert search.table["pipeline"].str.contains("TESS-SPOC").any()
-    assert search.table["pipeline"].str.contains("SPOC").any()
+    search = tres2b_s26.timeseries
+    pipelines = set(search.table["pipeline"].unique())
+    assert {"QLP", "TESS-SPOC", "SPOC"}.issubset(pipelines)
     # tess-spoc also produces tpfs
-    search = TESSSearch("TrES-2b", sector=26).cubedata
-    assert search.table["pipeline"].str.contains("TESS-SPOC").any()
-    assert search.table["pipeline"].str.contains("SPOC").any()
+    search = tres2b_s26.cubedata
+    pipelines = set(search.table["pipeline"].unique())
+    assert {"TESS-SPOC", "SPOC"}.issubset(pipelines)
 
 
-def test_qlp_ffi_lightcurve():
+def test_qlp_ffi_lightcurve(tres2b_s26):
     """Can we search and download an MIT QLP FFI light curve?"""
-    search = TESSSearch("TrES-2b", sector=26, pipeline="qlp").timeseries
+    search = tres2b_s26.timeseries.filter_table(pipeline="qlp")
     assert len(search) == 1
     assert search.pipeline[0] == "QLP"
     assert search.exptime[0] == 1800  # * u.second  # Sector 26 had 30-minute FFIs
 
 
-def test_spoc_ffi_lightcurve():
+def test_spoc_ffi_lightcurve(tres2b_s26):
     """Can we search and download a SPOC FFI light curve?"""
-    search = TESSSearch("TrES-2b", sector=26, pipeline="tess-spoc").timeseries
+    search = tres2b_s26.timeseries.filter_table(pipeline="tess-spoc")
     assert len(search) == 1
     assert search.pipeline[0] == "TESS-SPOC"
     assert search.exptime[0] == 1800  # * u.second  # Sector 26 had 30-minute FFIs
 
 
-def test_split_k2_campaigns():
+@pytest.mark.parametrize("campaign, target", SPLIT_CAMPAIGN_NAMES)
+def test_split_k2_campaigns(split_campaigns, campaign, target):
     """Do split K2 campaign sections appear separately in search results?"""
-    # Campaign 9
-    search_c09 = K2Search("EPIC 228162462", exptime="long", campaign=9).cubedata
-    assert search_c09.table["campaign"][0] == "09a"
-    assert search_c09.table["campaign"][1] == "09b"
-    # Campaign 10
-
-    search_c10 = K2Search("EPIC 228725972", exptime="long", campaign=10).cubedata
-    assert search_c10.table["campaign"][0] == "10a"
-    assert search_c10.table["campaign"][1] == "10b"
-    # Campaign 11
-    search_c11 = K2Search("EPIC 203830112", exptime="long", campaign=11).cubedata
-    assert search_c11.table["campaign"][0] == "11a"
-    assert search_c11.table["campaign"][1] == "11b"
+    search = split_campaigns[campaign, target].result().cubedata
+    assert search.table["campaign"][0] == f"{campaign:02d}a"
+    assert search.table["campaign"][1] == f"{campaign:02d}b"
 
 
 #   MAST is deprecating FFI search and retrieval through astroquery.  How should we handle this?
@@ -447,7 +466,9 @@ def test_tesscut():
 
 
 class TestMASTSearchFilter:
-    results = MASTSearch("Kepler 16b")
+    @pytest.fixture(scope="class")
+    def results(self):
+        return MASTSearch("Kepler 16b")
 
     @pytest.mark.parametrize(
         "target_name",
@@ -459,16 +480,16 @@ class TestMASTSearchFilter:
             [299096355, "299096355"],
         ),
     )
-    def test_target_name(self, target_name):
-        self.results.filter_table(target_name=target_name)
+    def test_target_name(self, results, target_name):
+        results.filter_table(target_name=target_name)
 
     @pytest.mark.parametrize("limit", (0, 10, 1000))
-    def test_limit(self, limit):
-        self.results.filter_table(limit=limit)
+    def test_limit(self, results, limit):
+        results.filter_table(limit=limit)
 
     @pytest.mark.parametrize("filetype", (0, "lightcurve"))
-    def test_filetype(self, filetype):
-        self.results.filter_table(filetype=filetype)
+    def test_filetype(self, results, filetype):
+        results.filter_table(filetype=filetype)
 
     @pytest.mark.parametrize(
         "exptime",
@@ -486,39 +507,37 @@ class TestMASTSearchFilter:
             "longest",
         ),
     )
-    def test_exptime(self, exptime):
-        self.results.filter_table(exptime=exptime)
+    def test_exptime(self, results, exptime):
+        results.filter_table(exptime=exptime)
 
     @pytest.mark.parametrize("distance", (0, 0.2, (0.2, 0.4)))
-    def test_distance(self, distance):
-        self.results.filter_table(distance=distance)
+    def test_distance(self, results, distance):
+        results.filter_table(distance=distance)
 
     @pytest.mark.parametrize("year", (0, 2013, (2000, 2020), [2013, 2019]))
-    def test_year(self, year):
-        self.results.filter_table(year=year)
+    def test_year(self, results, year):
+        results.filter_table(year=year)
 
     @pytest.mark.parametrize(
         "description", (0, "data", ["TPS", "report"], ("TPS", "report"))
     )
-    def test_description(self, description):
-        self.results.filter_table(description=description)
+    def test_description(self, results, description):
+        results.filter_table(description=description)
 
     @pytest.mark.parametrize("pipeline", (0, "Kepler", "spoc", ["kepler", "spoc"]))
-    def test_pipeline(self, pipeline):
-        self.results.filter_table(pipeline=pipeline)
+    def test_pipeline(self, results, pipeline):
+        results.filter_table(pipeline=pipeline)
 
     @pytest.mark.parametrize("sequence", (0, 14, [14, 15]))
-    def test_sequence(self, sequence):
-        self.results.filter_table(sequence=sequence)
+    def test_sequence(self, results, sequence):
+        results.filter_table(sequence=sequence)
 
     @pytest.mark.parametrize("mission", (0, "Kepler", "Tess", ["Kepler", "Tess"]))
-    def test_mission(self, mission):
-        self.results.filter_table(mission=mission)
+    def test_mission(self, results, mission):
+        results.filter_table(mission=mission)
 
-    def test_combination(
-        self,
-    ):
-        filter_results = self.results.filter_table(
+    def test_combination(self, results):
+        filter_results = results.filter_table(
             target_name=299096355,
             pipeline="SPOC",
             mission="TESS",
@@ -0,0 +1,149 @@
+"""Test features of search that do not need to query MAST."""
+
+from astropy.table import Table
+from astropy.time import Time
+from astroquery.mast import Observations
+import pandas as pd
+import pytest
+
+from lksearch.utils import SearchWarning
+
+from lksearch import MASTSearch, KeplerSearch, K2Search, TESSSearch
+
+
+def test_empty_searchresult():
+    """Does an empty SearchResult behave gracefully?"""
+    sr = MASTSearch(table=pd.DataFrame())
+    assert len(sr) == 0
+    str(sr)
+    with pytest.warns(SearchWarning, match="Cannot download"):
+        sr.download()
+
+
+@pytest.fixture
+def kepler_search():
+    """A KeplerSearch built from a table, so no MAST query is made"""
+    table = pd.DataFrame(
+        {
+            "target_name": ["kplr005112705"],
+            "pipeline": ["Kepler"],
+            "project": ["Kepler"],
+            "sequence_number": [pd.NA],
+            "description": ["Lightcurve Long Cadence (CLC) - Q11"],
+        }
+    )
+    return KeplerSearch(None, table=table)
+
+
+def test_kepler_parse_multiple_targets(kepler_search):
+    kepler_search._parse_input(["KIC 5112705", "kplr10058374"])
+    assert kepler_search.exact_target
+    assert kepler_search.exact_target_name == ["kplr005112705", "kplr010058374"]
+    assert kepler_search.target_search_string == "kplr005112705, kplr010058374"
+
+
+def test_kepler_parse_multiple_targets_errors(kepler_search):
+    with pytest.raises(ValueError, match="No targets"):
+        kepler_search._parse_input([])
+    with pytest.raises(TypeError, match="KIC IDs"):
+        kepler_search._parse_input(["KIC 5112705", "Kepler-10"])
+    kepler_search.search_radius = 1
+    with pytest.raises(ValueError, match="search_radius"):
+        kepler_search._parse_input(["KIC 5112705", "KIC 10058374"])
+
+
+FFI_IDS = pd.Series(
+    [
+        "tess2019199202929-s0014-1-1-0150-s",
+        "tess2019199205929-s0014-1-1-0150-s",
+        "tess2019199212929-s0014-1-1-0150-s",
+    ]
+)
+
+
+def test_ffi_time():
+    times = TESSSearch._ffi_time(FFI_IDS)
+    assert times.scale == "utc"
+    assert times[0].iso == "2019-07-18 20:29:29.000"
+    assert times[2].iso == "2019-07-18 21:29:29.000"
+
+
+def test_ffi_time_mask():
+    middle = Time("2019-07-18 20:59:29", scale="utc")
+    # Limits can be given as a Time or an MJD, and are both inclusive
+    mask = TESSSearch._ffi_time_mask(FFI_IDS, tmin=middle)
+    assert mask.tolist() == [False, True, True]
+    mask = TESSSearch._ffi_time_mask(FFI_IDS, tmax=middle.mjd)
+    assert mask.tolist() == [True, True, False]
+    mask = TESSSearch._ffi_time_mask(FFI_IDS, tmin=middle.mjd, tmax=middle)
+    assert mask.tolist() == [False, True, False]
+    assert TESSSearch._ffi_time_mask(FFI_IDS).all()
+    # Limits in other time scales are compared at the same instant
+    first = TESSSearch._ffi_time(FFI_IDS)[0].tdb
+    mask = TESSSearch._ffi_time_mask(FFI_IDS, tmin=first, tmax=first)
+    assert mask.tolist() == [True, False, False]
+
+
+def test_search_sector_ffis_time_range(monkeypatch):
+    ffi_obs = Table(
+        {
+            "obs_id": ["tess-s0014-1-1"],
+            "provenance_name": ["SPOC"],
+            "sequence_number": [14],
+        }
+    )
+    ffi_products = Table(
+        {
+            "obs_id": list(FFI_IDS) + ["tess2019199202929-s0014-1-1-0150-s"],
+            "productFilename": [f"{obs_id}_ffic.fits" for obs_id in FFI_IDS]
+            + ["tess2019199202929-s0014-1-1-0150-s_ffir.fits"],
+            "calib_level": [2, 2, 2, 1],
+        }
+    )
+    queries = []
+
+    def query_criteria(**criteria):
+        queries.append(criteria)
+        return ffi_obs
+
+    monkeypatch.setattr(Observations, "query_criteria", query_criteria)
+    monkeypatch.setattr(Observations, "get_product_list", lambda obs: ffi_products)
+
+    table = pd.DataFrame({"target_name": ["TIC 261136679"], "sequence_number": [14]})
+    search = TESSSearch(None, table=table)
+    search.target_search_string = "TIC 261136679"
+    middle = Time("2019-07-18 20:59:29", scale="utc")
+    ffis = search.search_sector_ffis(14, tmin=middle.tdb, tmax=middle.mjd + 1)
+
+    # The sector is found with a single query, then filtered locally
+    assert len(queries) == 1
+    assert queries[0]["sequence_number"] == 14
+    assert ffis.table["obs_id"].tolist() == list(FFI_IDS[1:])
+    assert ffis.table["sector"].tolist() == [14, 14]
+
+
+def test_k2_campaign_order():
+    campaigns = ["10a", "4", "11b", "09b", "10b", "09a", "19"]
+    expected = ["4", "09a", "09b", "10a", "10b", "11b", "19"]
+    assert sorted(campaigns, key=K2Search._campaign_order) == expected
+
+    table = pd.DataFrame(
+        {
+            "sequence_number": pd.array([10, 4, 9, 10, 9], dtype="Int64"),
+            "productFilename": [
+                "ktwo228725972-c102_lpd-targ.fits.gz",
+                "ktwo210634047-c04_lpd-targ.fits.gz",
+                "ktwo228162462-c91_lpd-targ.fits.gz",
+                "ktwo228725972-c101_lpd-targ.fits.gz",
+                "ktwo228162462-c92_lpd-targ.fits.gz",
+            ],
+            "pipeline": ["K2"] * 5,
+            "distance": [0.0] * 5,
+            "exptime": [1800.0] * 5,
+        }
+    )
+    search = K2Search(None, table=table)
+    search._fix_K2_sequence()
+    search._sort_K2()
+    assert search.table["campaign"].cat.ordered
+    assert search.table["campaign"].tolist() == ["4", "09a", "09b", "10a", "10b"]